@@ -20,25 +20,45 @@ from jax import core
 from jax import jit
 from jax import lax
 from jax._src import dtypes
+from jax._src.lax import lax as lax_internal
 from jax._src.numpy.lax_numpy import (
-    all, arange, argmin, array, asarray, atleast_1d, concatenate, convolve, diag, dot,
-    finfo, full, maximum, ones, outer, roll, sqrt, trim_zeros, trim_zeros_tol, true_divide,
-    vander, zeros)
+    all, arange, argmin, array, asarray, atleast_1d, broadcast_to, concatenate, conj,
+    convolve, diag, dot, finfo, full, ones, ones_like, outer, real, roll, sqrt, stack,
+    tensordot, trim_zeros, trim_zeros_tol, true_divide, vander, vdot, zeros)
 from jax._src.numpy import linalg
 from jax._src.numpy.util import _check_arraylike, _promote_dtypes, _promote_dtypes_inexact, _where, _wraps
 import numpy as np
 
 
+_lax_const = lax_internal._const
+
+
 @jit
 def _roots_no_zeros(p):
-  # build companion matrix and find its eigenvalues (the roots)
   if p.size < 2:
     return array([], dtype=dtypes.to_complex_dtype(p.dtype))
+  # Use closed forms for linear and quadratic polynomials, which are both common
+  # and much cheaper than a general nonsymmetric eigendecomposition.
+  if p.size == 2:
+    return (-p[1:] / p[0]).astype(dtypes.to_complex_dtype(p.dtype))
+  if p.size == 3:
+    return _roots_quadratic(*p.astype(dtypes.to_complex_dtype(p.dtype)))
+  # build companion matrix and find its eigenvalues (the roots)
   A = diag(ones((p.size - 2,), p.dtype), -1)
   A = A.at[0, :].set(-p[1:] / p[0])
   return linalg.eigvals(A)
 
 
+def _roots_quadratic(a, b, c):
+  # Choose the sign of the square root so that it does not cancel against b,
+  # then recover the smaller root from the product of the roots, c / a.
+  sqrt_disc = sqrt(b * b - 4 * a * c)
+  sqrt_disc = _where(real(conj(b) * sqrt_disc) < 0, -sqrt_disc, sqrt_disc)
+  q = -(b + sqrt_disc) / 2
+  # q is zero only if b and c are, in which case both roots are zero.
+  return stack([q / a, _where(q == 0, 0, c / _where(q == 0, 1, q))])
+
+
 @jit
 def _roots_with_zeros(p, num_leading_zeros):
   # Avoid lapack errors when p is all zero
@@ -100,9 +120,20 @@ _POLYFIT_DOC = """\
 Unlike NumPy's implementation of polyfit, :py:func:`jax.numpy.polyfit` will not warn on rank reduction, which indicates an ill conditioned matrix
 Also, it works best on rcond <= 10e-3 values.
 """
-@_wraps(np.polyfit, lax_description=_POLYFIT_DOC)
-@partial(jit, static_argnames=('deg', 'rcond', 'full', 'cov'))
-def polyfit(x, y, deg, rcond=None, full=False, w=None, cov=False):
+@_wraps(np.polyfit, lax_description=_POLYFIT_DOC,
+extra_params="""
+skip_scaling : bool, default=False
+    If set to True, the columns of the Vandermonde matrix are not rescaled to
+    unit norm before solving the least squares problem. This saves a pass over
+    the matrix and is safe for well-conditioned sample points (e.g. Chebyshev
+    nodes on [-1, 1] with a modest ``deg``). For badly distributed points or
+    high degrees the unscaled matrix is ill-conditioned, and the fit may lose
+    accuracy or be truncated by ``rcond``. The singular values returned with
+    ``full=True`` are those of the unscaled matrix.
+""")
+@partial(jit, static_argnames=('deg', 'rcond', 'full', 'cov', 'skip_scaling'))
+def polyfit(x, y, deg, rcond=None, full=False, w=None, cov=False, *,
+            skip_scaling=False):
   _check_arraylike("polyfit", x, y)
   deg = core.concrete_or_error(int, deg, "deg must be int")
   order = deg + 1
@@ -141,16 +172,19 @@ def polyfit(x, y, deg, rcond=None, full=False, w=None, cov=False):
       rhs *= w
 
   # scale lhs to improve condition number and solve
-  scale = sqrt((lhs*lhs).sum(axis=0))
-  lhs /= scale[np.newaxis,:]
+  if not skip_scaling:
+    scale = linalg.norm(lhs, axis=0)
+    lhs /= scale[np.newaxis,:]
   c, resids, rank, s = linalg.lstsq(lhs, rhs, rcond)
-  c = (c.T/scale).T  # broadcast scale coefficients
+  if not skip_scaling:
+    c = (c.T/scale).T  # broadcast scale coefficients
 
   if full:
     return c, resids, rank, s, rcond
   elif cov:
     Vbase = linalg.inv(dot(lhs.T, lhs))
-    Vbase /= outer(scale, scale)
+    if not skip_scaling:
+      Vbase /= outer(scale, scale)
     if cov == "unscaled":
       fac = 1
     else:
@@ -167,6 +201,77 @@ def polyfit(x, y, deg, rcond=None, full=False, w=None, cov=False):
     return c
 
 
+@partial(jit, static_argnames=('deg', 'rcond'))
+def _polyfit_arnoldi(x, y, deg, rcond=None, w=None):
+  # Least squares fit of a polynomial of degree deg, solved in a basis of
+  # polynomials q_0, ..., q_deg orthonormal on the (weighted) sample points
+  # rather than in the monomial basis, whose Vandermonde matrix is hopelessly
+  # ill-conditioned at high degrees. Returns the coefficients c of the q_k,
+  # lowest degree first, and the Hessenberg matrix H of the recurrence that
+  # defines the q_k; evaluate the fit with _polyval_arnoldi(c, H, x).
+  # Converting c to monomial coefficients would lose the accuracy gained.
+  _check_arraylike("polyfit", x, y)
+  deg = core.concrete_or_error(int, deg, "deg must be int")
+  if deg < 0:
+    raise ValueError("expected deg >= 0")
+  if x.ndim != 1:
+    raise TypeError("expected 1D vector for x")
+  if y.ndim < 1 or y.ndim > 2:
+    raise TypeError("expected 1D or 2D array for y")
+  if x.shape[0] != y.shape[0]:
+    raise TypeError("expected x and y to have same length")
+  if rcond is None:
+    rcond = len(x) * finfo(x.dtype).eps
+  rhs = y
+  if w is not None:
+    _check_arraylike("polyfit", w)
+    w, = _promote_dtypes_inexact(w)
+    rhs = rhs * (w[:, np.newaxis] if rhs.ndim == 2 else w)
+  Q, H, q_0_norm = _vander_arnoldi(x, deg + 1, w)
+  c = linalg.lstsq(Q, rhs, rcond)[0]
+  return c / q_0_norm, H
+
+
+def _vander_arnoldi(x, order, w=None):
+  # Arnoldi iteration on diag(x) starting from the weights, i.e. Gram-Schmidt
+  # on the columns of the weighted Vandermonde matrix. Returns Q with
+  # orthonormal columns, the Hessenberg matrix H with x * Q[:, :-1] == Q @ H,
+  # and the norm of the weights. Column k of Q is the weighted polynomial q_k
+  # at the sample points divided by that norm, where q_0 == 1 and
+  # x * q_{k-1} == sum_j H[j, k-1] * q_j.
+  x, q = _promote_dtypes_inexact(x, ones_like(x) if w is None else w)
+  q_0_norm = linalg.norm(q)
+  Q = [q / q_0_norm]
+  H = []
+  for k in range(1, order):
+    v = x * Q[-1]
+    h = []
+    for j in range(k):
+      h.append(vdot(Q[j], v))
+      v -= h[-1] * Q[j]
+    h.append(linalg.norm(v))
+    Q.append(v / h[-1])
+    H.append(concatenate([stack(h).astype(x.dtype),
+                          zeros(order - k - 1, dtype=x.dtype)]))
+  H = stack(H, axis=1) if H else zeros((order, 0), dtype=x.dtype)
+  return stack(Q, axis=1), H, q_0_norm
+
+
+@jit
+def _polyval_arnoldi(c, H, x):
+  # Evaluates a fit returned by _polyfit_arnoldi at x. The result has shape
+  # x.shape + c.shape[1:].
+  c, H, x = _promote_dtypes_inexact(c, H, x)
+  Q = zeros((c.shape[0],) + x.shape, dtype=x.dtype).at[0].set(1)
+  def step(k, Q):
+    # Rows k and above of Q are still zero, so contracting with the whole
+    # column of H only sums over q_0, ..., q_{k-1}.
+    v = x * Q[k - 1] - tensordot(H[:, k - 1], Q, axes=1)
+    return Q.at[k].set(v / H[k, k - 1])
+  Q = lax.fori_loop(1, c.shape[0], step, Q)
+  return tensordot(Q, c, axes=(0, 0))
+
+
 _POLY_DOC = """\
 This differs from np.poly when an integer array is given.
 np.poly returns a result with dtype float64 in this case.
@@ -199,39 +304,110 @@ def poly(seq_of_zeros):
   if len(seq_of_zeros) == 0:
     return ones((), dtype=dt)
 
-  a = ones((1,), dtype=dt)
-  for k in range(len(seq_of_zeros)):
-    a = convolve(a, array([1, -seq_of_zeros[k]], dtype=dt), mode='full')
+  factors = stack([ones(seq_of_zeros.shape, dtype=dt), -seq_of_zeros], axis=1)
+  return _poly_reduce(factors)
 
-  return a
+
+def _poly_reduce(factors):
+  # Multiply the rows of `factors` together as polynomials. Splitting in halves
+  # gives a balanced product tree of depth log2(len(factors)) rather than a
+  # sequential chain of len(factors) convolutions.
+  if len(factors) == 1:
+    return factors[0]
+  mid = len(factors) // 2
+  return convolve(_poly_reduce(factors[:mid]), _poly_reduce(factors[mid:]),
+                  mode='full')
 
 
 @_wraps(np.polyval, lax_description="""\
-The ``unroll`` parameter is JAX specific. It does not effect correctness but can
-have a major impact on performance for evaluating high-order polynomials. The
-parameter controls the number of unrolled steps with ``lax.scan`` inside the
-``polyval`` implementation. Consider setting ``unroll=128`` (or even higher) to
-improve runtime performance on accelerators, at the cost of increased
-compilation time.
+The ``unroll`` and ``method`` parameters are JAX specific. They can have a major
+impact on performance for evaluating high-order polynomials. ``unroll`` does not
+affect the result; ``method`` can, as described below.
+
+``method='scan'`` (the default) evaluates the polynomial with Horner's scheme
+inside a ``lax.scan``, and ``unroll`` controls the number of unrolled steps of
+the scan. Consider setting ``unroll=128`` (or even higher) to improve runtime
+performance on accelerators, at the cost of increased compilation time. If
+``len(p) <= unroll``, no loop is emitted and the multiply-adds are traced
+directly.
+
+``method='estrin'`` uses Estrin's scheme, which combines pairs of coefficients
+in a tree of depth ``log2(len(p))`` rather than a chain of ``len(p)`` dependent
+multiply-adds. This exposes more parallelism, at the cost of intermediate
+buffers of size ``len(p) // 2`` times the size of the output. ``unroll`` is
+ignored in this case. Estrin's scheme also rounds differently from Horner's,
+and it squares ``x`` repeatedly, so the powers of ``x`` up to the degree of the
+polynomial appear as intermediates. For large ``|x|`` in low precision (e.g.
+``float16``) these can overflow where Horner's scheme does not.
+
+The ``tile_size`` parameter is also JAX specific, and is only supported for
+one-dimensional ``p``. If set, ``x`` is flattened and evaluated in sequential
+tiles of ``tile_size`` elements with ``lax.map``, so that each tile stays in
+cache across all coefficients of a long ``p``. This can help on CPU for large
+``x``; on accelerators it serializes work that would otherwise run in parallel.
 """)
-@partial(jit, static_argnames=['unroll'])
-def polyval(p, x, *, unroll=16):
+@partial(jit, static_argnames=['unroll', 'method', 'tile_size'])
+def polyval(p, x, *, unroll=16, method='scan', tile_size=None):
   _check_arraylike("polyval", p, x)
+  if method not in ['scan', 'estrin']:
+    raise ValueError(f"{method!r} is an invalid value for keyword 'method'. "
+                     "Expected one of ['scan', 'estrin'].")
   p, x = _promote_dtypes_inexact(p, x)
+  if tile_size is not None:
+    if tile_size < 1:
+      raise ValueError(f"polyval: tile_size must be a positive integer; got {tile_size}")
+    if p.ndim != 1:
+      raise ValueError(f"polyval: tile_size requires a 1D p; got p.shape={p.shape}")
+    if x.size > tile_size:
+      return _polyval_tiled(p, x, unroll, method, tile_size)
   shape = lax.broadcast_shapes(p.shape[1:], x.shape)
   y = lax.full_like(x, 0, shape=shape, dtype=x.dtype)
+  if method == 'estrin':
+    return _polyval_estrin(p, x, y) if p.shape[0] else y
+  if p.shape[0] <= unroll:
+    for i in range(p.shape[0]):
+      y = y * x + p[i]
+    return y
   y, _ = lax.scan(lambda y, p: (y * x + p, None), y, p, unroll=unroll)
   return y
 
+def _polyval_tiled(p, x, unroll, method, tile_size):
+  num_tiles = -(-x.size // tile_size)
+  x_tiles = lax.pad(x.ravel(), _lax_const(x, 0), [(0, num_tiles * tile_size - x.size, 0)])
+  y_tiles = lax.map(partial(polyval, p, unroll=unroll, method=method),
+                    x_tiles.reshape(num_tiles, tile_size))
+  return y_tiles.ravel()[:x.size].reshape(x.shape)
+
+def _polyval_estrin(p, x, y):
+  # Line up the trailing dimensions of p with the output so each level below is
+  # a single broadcasted multiply-add. Coefficients are paired from the constant
+  # term up; when their number is odd, the leading one has no partner and is
+  # carried to the next level unchanged.
+  p = lax.expand_dims(p, tuple(range(1, y.ndim - p.ndim + 2)))
+  while p.shape[0] > 1:
+    odd = p.shape[0] % 2
+    q = p[odd::2] * x + p[odd + 1::2]
+    if odd:
+      q = concatenate([broadcast_to(p[:1], (1,) + q.shape[1:]), q])
+    p = q
+    if p.shape[0] > 1:
+      x = x * x
+  return y + p[0]
+
 @_wraps(np.polyadd)
 @jit
 def polyadd(a1, a2):
   _check_arraylike("polyadd", a1, a2)
   a1, a2 = _promote_dtypes(a1, a2)
   if a2.shape[0] <= a1.shape[0]:
-    return a1.at[-a2.shape[0]:].add(a2)
+    return a1 + _pad_leading(a2, a1.shape[0] - a2.shape[0])
   else:
-    return a2.at[-a1.shape[0]:].add(a1)
+    return a2 + _pad_leading(a1, a2.shape[0] - a1.shape[0])
+
+def _pad_leading(a, n):
+  # Zero-pad the front of the leading axis, so that adding to a longer
+  # polynomial is elementwise rather than an update of a slice.
+  return lax.pad(a, _lax_const(a, 0), [(n, 0, 0)] + [(0, 0, 0)] * (a.ndim - 1))
 
 
 @_wraps(np.polyint)
@@ -251,10 +427,11 @@ def polyint(p, m=1, k=None):
   if m == 0:
     return p
   else:
-    grid = (arange(len(p) + m, dtype=p.dtype)[np.newaxis]
-            - arange(m, dtype=p.dtype)[:, np.newaxis])
-    coeff = maximum(1, grid).prod(0)[::-1]
-    return true_divide(concatenate((p, k)), coeff)
+    # coeff depends only on static shapes, so compute it as a constant.
+    grid = (np.arange(len(p) + m, dtype=np.float64)[np.newaxis]
+            - np.arange(m, dtype=np.float64)[:, np.newaxis])
+    coeff = np.maximum(1, grid).prod(0)[::-1]
+    return true_divide(concatenate((p, k)), asarray(coeff, dtype=p.dtype))
 
 
 @_wraps(np.polyder)
@@ -267,9 +444,10 @@ def polyder(p, m=1):
     raise ValueError("Order of derivative must be positive")
   if m == 0:
     return p
-  coeff = (arange(m, len(p), dtype=p.dtype)[np.newaxis]
-          - arange(m, dtype=p.dtype)[:, np.newaxis]).prod(0)
-  return p[:-m] * coeff[::-1]
+  # coeff depends only on static shapes, so compute it as a constant.
+  coeff = (np.arange(m, len(p), dtype=np.float64)[np.newaxis]
+           - np.arange(m, dtype=np.float64)[:, np.newaxis]).prod(0)
+  return p[:-m] * asarray(coeff[::-1], dtype=p.dtype)
 
 
 _LEADING_ZEROS_DOC = """\
@@ -299,11 +477,14 @@ def polydiv(u, v, *, trim_leading_zeros=False):
   m = len(u) - 1
   n = len(v) - 1
   scale = 1. / v[0]
-  q = zeros(max(m - n + 1, 1), dtype = u.dtype) # force same dtype
-  for k in range(0, m-n+1):
-    d = scale * u[k]
-    q = q.at[k].set(d)
-    u = u.at[k:k+n+1].add(-d*v)
+  if m < n:
+    q = zeros(1, dtype=u.dtype)
+  else:
+    def step(u, k):
+      d = scale * u[k]
+      u = lax.dynamic_update_slice(u, lax.dynamic_slice(u, (k,), (n + 1,)) - d * v, (k,))
+      return u, d
+    u, q = lax.scan(step, u, arange(m - n + 1))
   if trim_leading_zeros:
     # use the square root of finfo(dtype) to approximate the absolute tolerance used in numpy
     return q, trim_zeros_tol(u, tol=sqrt(finfo(u.dtype).eps), trim='f')
@@ -20,10 +20,11 @@ from typing import Optional
 from jax._src import dtypes
 from jax._src.lax import lax as lax_internal
 from jax._src.numpy.lax_numpy import (
-    any, append, arange, array, asarray, concatenate, cumsum, diff,
-    empty, full_like, isnan, lexsort, moveaxis, nonzero, ones, ravel,
-    sort, where, zeros)
-from jax._src.numpy.util import _check_arraylike, _wraps
+    any, arange, array, asarray, concatenate, cumsum,
+    empty, full_like, isnan, lexsort, minimum, moveaxis, nonzero, ones, ravel,
+    searchsorted, sort, where, zeros)
+from jax._src.numpy.util import _check_arraylike, _promote_dtypes, _wraps
+from jax._src.ops.scatter import segment_sum
 from jax._src.util import prod as _prod
 from jax import core
 from jax import jit
@@ -33,6 +34,10 @@ import numpy as np
 
 _lax_const = lax_internal._const
 
+# in1d compares all pairs of elements when the second argument is smaller than
+# this, and uses a sort-based lookup otherwise.
+_IN1D_COMPARE_ALL_MAX_SIZE = 64
+
 
 @_wraps(np.in1d, lax_description="""
 In the JAX version, the `assume_unique` argument is not referenced.
@@ -43,19 +48,36 @@ def in1d(ar1, ar2, assume_unique=False, invert=False):  # noqa: F811
   _check_arraylike("in1d", ar1, ar2)
   ar1 = ravel(ar1)
   ar2 = ravel(ar2)
-  # Note: an algorithm based on searchsorted has better scaling, but in practice
-  # is very slow on accelerators because it relies on lax control flow. If XLA
-  # ever supports binary search natively, we should switch to this:
-  #   ar2 = jnp.sort(ar2)
-  #   ind = jnp.searchsorted(ar2, ar1)
-  #   if invert:
-  #     return ar1 != ar2[ind]
-  #   else:
-  #     return ar1 == ar2[ind]
-  if invert:
-    return (ar1[:, None] != ar2[None, :]).all(-1)
-  else:
-    return (ar1[:, None] == ar2[None, :]).any(-1)
+  # For small ar2 the all-pairs comparison is cheap and fuses well. Otherwise we
+  # look up each element of ar1 in a sorted copy of ar2, which needs O(M + N)
+  # memory rather than O(M * N).
+  if ar2.size < _IN1D_COMPARE_ALL_MAX_SIZE:
+    if invert:
+      return (ar1[:, None] != ar2[None, :]).all(-1)
+    else:
+      return (ar1[:, None] == ar2[None, :]).any(-1)
+  ar1, ar2 = _promote_dtypes(ar1, ar2)
+  # searchsorted's 'sort' method avoids lax control flow, which is slow on
+  # accelerators. In exchange it argsorts the M + N concatenation of ar1 and
+  # ar2 as well as ar1 itself, with a scatter after each to compute ranks.
+  mask, _ = _in1d_sorted(ar1, sort(ar2), method='sort')
+  return ~mask if invert else mask
+
+
+@partial(jit, static_argnames=('method',))
+def _in1d_sorted(ar1, ar2, *, method):
+  """
+    Helper function for in1d and intersect1d, for sorted 1D ar2.
+
+    Returns a mask of the elements of ar1 that are present in ar2, and for
+    those elements the index of a matching element of ar2. ``method`` is passed
+    to searchsorted.
+    """
+  if ar2.size == 0:
+    return zeros(ar1.shape, dtype=bool), zeros(ar1.shape, dtype=int)
+  ind = minimum(searchsorted(ar2, ar1, method=method), ar2.size - 1)
+  return ar2[ind] == ar1, ind
+
 
 @_wraps(np.setdiff1d,
   lax_description=_dedent("""
@@ -81,14 +103,16 @@ def setdiff1d(ar1, ar2, assume_unique=False, *, size=None, fill_value=None):
   if ar1.size == 0:
     return full_like(ar1, fill_value, shape=size or 0)
   if not assume_unique:
-    ar1 = unique(ar1, size=size and ar1.size)
+    if size is None:
+      ar1 = unique(ar1)
+    else:
+      ar1, n_unique = _unique(ravel(ar1), 0, size=ar1.size, return_true_size=True)
   mask = in1d(ar1, ar2, invert=True)
   if size is None:
     return ar1[mask]
   else:
-    if not (assume_unique or size is None):
+    if not assume_unique:
       # Set mask to zero at locations corresponding to unique() padding.
-      n_unique = ar1.size + 1 - (ar1 == ar1[0]).sum()
       mask = where(arange(ar1.size) < n_unique, mask, False)
     return where(arange(size) < mask.sum(), ar1[where(mask, size=size)], fill_value)
 
@@ -149,7 +173,8 @@ def _intersect1d_sorted_mask(ar1, ar2, return_indices=False):
     """
   ar = concatenate((ar1, ar2))
   if return_indices:
-    iota = lax.broadcasted_iota(np.int64, np.shape(ar), dimension=0)
+    dtype = np.int32 if ar.size <= np.iinfo(np.int32).max else np.int64
+    iota = lax.broadcasted_iota(dtype, np.shape(ar), dimension=0)
     aux, indices = lax.sort_key_val(ar, iota)
   else:
     aux = sort(ar)
@@ -174,9 +199,17 @@ def intersect1d(ar1, ar2, assume_unique=False, return_indices=False):
     else:
       ar1 = unique(ar1)
       ar2 = unique(ar2)
-  else:
-    ar1 = ravel(ar1)
-    ar2 = ravel(ar2)
+    # Both arrays are now sorted, so we can look up the elements of ar1 in ar2
+    # rather than sorting their concatenation.
+    ar1, ar2 = _promote_dtypes(ar1, ar2)
+    mask, ar2_indices = _in1d_sorted(ar1, ar2, method='scan')
+    if return_indices:
+      return ar1[mask], ind1[mask], ind2[ar2_indices[mask]]
+    else:
+      return ar1[mask]
+
+  ar1 = ravel(ar1)
+  ar2 = ravel(ar2)
 
   if return_indices:
     aux, mask, aux_sort_indices = _intersect1d_sorted_mask(ar1, ar2, return_indices)
@@ -186,12 +219,10 @@ def intersect1d(ar1, ar2, assume_unique=False, return_indices=False):
   int1d = aux[:-1][mask]
 
   if return_indices:
-    ar1_indices = aux_sort_indices[:-1][mask]
-    ar2_indices = aux_sort_indices[1:][mask] - ar1.size
-    if not assume_unique:
-      ar1_indices = ind1[ar1_indices]
-      ar2_indices = ind2[ar2_indices]
-
+    # The sort payload may be int32; return indices in the default int type.
+    int_ = dtypes.canonicalize_dtype(dtypes.int_)
+    ar1_indices = aux_sort_indices[:-1][mask].astype(int_)
+    ar2_indices = aux_sort_indices[1:][mask].astype(int_) - ar1.size
     return int1d, ar1_indices, ar2_indices
   else:
     return int1d
@@ -220,12 +251,18 @@ def _unique_sorted_mask(ar, axis):
     # is fixed to match numpy.
     aux = where(isnan(aux), _lax_const(aux, np.nan), aux)
   size, *out_shape = aux.shape
-  if _prod(out_shape) == 0:
+  if aux.ndim == 1:
+    # Sort the values along with their indices, rather than gathering them
+    # through a lexsort permutation.
+    iota = lax.broadcasted_iota(dtypes.int_, aux.shape, 0)
+    aux, perm = lax.sort_key_val(aux, iota)
+  elif _prod(out_shape) == 0:
     size = 1
     perm = zeros(1, dtype=int)
+    aux = aux[perm]
   else:
     perm = lexsort(aux.reshape(size, _prod(out_shape)).T[::-1])
-  aux = aux[perm]
+    aux = aux[perm]
   if aux.size:
     if dtypes.issubdtype(aux.dtype, np.inexact):
       # This is appropriate for both float and complex due to the documented behavior of np.unique:
@@ -248,6 +285,7 @@ def _unique(ar, axis, return_index=False, return_inverse=False, return_counts=Fa
       "jnp.unique: for zero-sized input with nonzero size argument, fill_value must be specified")
 
   aux, mask, perm = _unique_sorted_mask(ar, axis)
+  num_unique = mask.sum()
   if size is None:
     ind = core.concrete_or_error(None, mask,
         "The error arose in jnp.unique(). " + UNIQUE_SIZE_HINT)
@@ -258,7 +296,7 @@ def _unique(ar, axis, return_index=False, return_inverse=False, return_counts=Fa
     fill_value = asarray(fill_value, dtype=result.dtype)
   if size is not None and fill_value is not None:
     if result.shape[0]:
-      valid = lax.expand_dims(arange(size) < mask.sum(), tuple(range(1, result.ndim)))
+      valid = lax.expand_dims(arange(size) < num_unique, tuple(range(1, result.ndim)))
       result = where(valid, result, fill_value)
     else:
       result = full_like(result, fill_value, shape=(size, *result.shape[1:]))
@@ -273,26 +311,27 @@ def _unique(ar, axis, return_index=False, return_inverse=False, return_counts=Fa
   if return_inverse:
     if aux.size:
       imask = cumsum(mask) - 1
-      inv_idx = zeros(mask.shape, dtype=dtypes.canonicalize_dtype(dtypes.int_))
-      inv_idx = inv_idx.at[perm].set(imask)
+      # perm is a permutation, so sorting imask by it inverts the permutation
+      # without the unsorted scatter inv_idx.at[perm].set(imask) would need.
+      inv_idx = lax.sort_key_val(perm, imask)[1]
     else:
       inv_idx = zeros(ar.shape[axis], dtype=int)
     ret += (inv_idx,)
   if return_counts:
     if aux.size:
-      if size is None:
-        idx = append(nonzero(mask)[0], mask.size)
-      else:
-        idx = nonzero(mask, size=size + 1)[0]
-        idx = idx.at[1:].set(where(idx[1:], idx[1:], mask.size))
-      ret += (diff(idx),)
+      # Each sorted element belongs to the segment of the unique value before
+      # it; with a fixed size, segments past the end are dropped.
+      num_segments = int(num_unique) if size is None else size
+      segment_ids = cumsum(mask) - 1
+      ret += (segment_sum(ones(mask.size, dtype=int), segment_ids, num_segments,
+                          indices_are_sorted=True),)
     elif ar.shape[axis]:
       ret += (array([ar.shape[axis]], dtype=dtypes.canonicalize_dtype(dtypes.int_)),)
     else:
       ret += (empty(0, dtype=int),)
   if return_true_size:
     # Useful for internal uses of unique().
-    ret += (mask.sum(),)
+    ret += (num_unique,)
   return ret[0] if len(ret) == 1 else ret
 
 @_wraps(np.unique, skip_params=['axis'],
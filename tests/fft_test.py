@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+import functools
 import itertools
 
 import numpy as np
@@ -29,19 +30,20 @@ from jax._src.numpy.util import _promote_dtypes_complex
 
 from jax.config import config
 config.parse_flags_with_absl()
+FLAGS = config.FLAGS
 
 FFT_NORMS = [None, "ortho", "forward", "backward"]
 
 
-float_dtypes = jtu.dtypes.floating
-inexact_dtypes = jtu.dtypes.inexact
-real_dtypes = float_dtypes + jtu.dtypes.integer + jtu.dtypes.boolean
-all_dtypes = real_dtypes + jtu.dtypes.complex
+float_dtypes = tuple(jtu.dtypes.floating)
+inexact_dtypes = tuple(jtu.dtypes.inexact)
+real_dtypes = float_dtypes + tuple(jtu.dtypes.integer + jtu.dtypes.boolean)
+all_dtypes = real_dtypes + tuple(jtu.dtypes.complex)
 
 
-def _get_fftn_test_axes(shape):
-  axes = [[]]
-  ndims = len(shape)
+@functools.lru_cache(maxsize=None)
+def _fftn_test_axes_for_ndim(ndims):
+  axes = [()]
   # XLA's FFT op only supports up to 3 innermost dimensions.
   if ndims <= 3:
     axes.append(None)
@@ -49,14 +51,20 @@ def _get_fftn_test_axes(shape):
     axes.extend(itertools.combinations(range(ndims), naxes))
   for index in range(1, ndims + 1):
     axes.append((-index,))
-  return axes
+  return tuple(axes)
 
-def _get_fftn_test_s(shape, axes):
-  s_list = [None]
-  if axes is not None:
-    s_list.extend(itertools.product(*[[shape[ax]+i for i in range(-shape[ax]+1, shape[ax]+1)] for ax in axes]))
-  return s_list
+def _get_fftn_test_axes(shape):
+  return _fftn_test_axes_for_ndim(len(shape))
 
+def _check_grads(f, args, tol):
+  # Second-order checks dominate the cost of these tests; only run a
+  # first-order reverse-mode check when slow tests are skipped.
+  if FLAGS.jax_skip_slow_tests:
+    jtu.check_grads(f, args, order=1, modes=["rev"], atol=tol, rtol=tol)
+  else:
+    jtu.check_grads(f, args, order=2, atol=tol, rtol=tol)
+
+@functools.lru_cache(maxsize=None)
 def _get_fftn_func(module, inverse, real):
   if inverse:
     return _irfft_with_zeroed_inputs(module.irfftn) if real else module.ifftn
@@ -81,14 +89,14 @@ def _zero_for_irfft(z, axes):
     size = z.shape[axis]
   except IndexError:
     return z  # only if axis is invalid, as occurs in some tests
+  if not jnp.iscomplexobj(z):
+    return z
+  keep_imag = np.ones(size, dtype=bool)
+  keep_imag[0] = False
   if size % 2:
-    parts = [lax.slice_in_dim(z.real, 0, 1, axis=axis).real,
-             lax.slice_in_dim(z.real, 1, size - 1, axis=axis),
-             lax.slice_in_dim(z.real, size - 1, size, axis=axis).real]
-  else:
-    parts = [lax.slice_in_dim(z.real, 0, 1, axis=axis).real,
-             lax.slice_in_dim(z.real, 1, size, axis=axis)]
-  return jnp.concatenate(parts, axis=axis)
+    keep_imag[-1] = False
+  keep_imag = keep_imag.reshape((size,) + (1,) * (z.ndim - axis % z.ndim - 1))
+  return lax.complex(z.real, jnp.where(keep_imag, z.imag, 0))
 
 
 class FftTest(jtu.JaxTestCase):
@@ -140,18 +148,17 @@ class FftTest(jtu.JaxTestCase):
     self.assertAllClose(y, z)
 
   @parameterized.named_parameters(jtu.cases_from_list(
-      {"testcase_name": "_inverse={}_real={}_shape={}_axes={}_s={}_norm={}".format(
-          inverse, real, jtu.format_shape_dtype_string(shape, dtype), axes, s, norm),
-       "axes": axes, "shape": shape, "dtype": dtype, "inverse": inverse, "real": real, "s": s, "norm":norm}
+      {"testcase_name": "_inverse={}_real={}_shape={}_axes={}_norm={}".format(
+          inverse, real, jtu.format_shape_dtype_string(shape, dtype), axes, norm),
+       "axes": axes, "shape": shape, "dtype": dtype, "inverse": inverse, "real": real, "norm":norm}
       for inverse in [False, True]
       for real in [False, True]
       for dtype in (real_dtypes if real and not inverse else all_dtypes)
       for shape in [(10,), (10, 10), (9,), (2, 3, 4), (2, 3, 4, 5)]
       for axes in _get_fftn_test_axes(shape)
-      for s in _get_fftn_test_s(shape, axes)
       for norm in FFT_NORMS
       ))
-  def testFftn(self, inverse, real, shape, dtype, axes, s, norm):
+  def testFftn(self, inverse, real, shape, dtype, axes, norm):
     rng = jtu.rand_default(self.rng())
     args_maker = lambda: (rng(shape, dtype),)
     jnp_op = _get_fftn_func(jnp.fft, inverse, real)
@@ -167,10 +174,10 @@ class FftTest(jtu.JaxTestCase):
         dtype in (float_dtypes if real and not inverse else inexact_dtypes)):
       # TODO(skye): can we be more precise?
       tol = 0.15
-      jtu.check_grads(jnp_fn, args_maker(), order=2, atol=tol, rtol=tol)
+      _check_grads(jnp_fn, args_maker(), tol)
 
     # check dtypes
-    dtype = jnp_fn(rng(shape, dtype)).dtype
+    dtype = jax.eval_shape(jnp_fn, jax.ShapeDtypeStruct(shape, dtype)).dtype
     expected_dtype = jnp.promote_types(float if inverse and real else complex, dtype)
     self.assertEqual(dtype, expected_dtype)
 
@@ -181,8 +188,7 @@ class FftTest(jtu.JaxTestCase):
 
     def func(x):
       x, = _promote_dtypes_complex(x)
-      return jnp.fft.irfft(jnp.concatenate([jnp.zeros_like(x, shape=1),
-                                            x[:2] + 1j*x[2:]]))
+      return jnp.fft.irfft(jnp.zeros(3, x.dtype).at[1:].set(x[:2] + 1j*x[2:]))
 
     def func_transpose(x):
       return jax.linear_transpose(func, x)(x)[0]
@@ -368,7 +374,7 @@ class FftTest(jtu.JaxTestCase):
     # Test gradient for differentiable types.
     if dtype in inexact_dtypes:
       tol = 0.15  # TODO(skye): can we be more precise?
-      jtu.check_grads(jnp_fn, args_maker(), order=2, atol=tol, rtol=tol)
+      _check_grads(jnp_fn, args_maker(), tol)
 
   @parameterized.named_parameters(jtu.cases_from_list(
     {"testcase_name": f"_n={n}",
@@ -411,7 +417,7 @@ class FftTest(jtu.JaxTestCase):
     # Test gradient for differentiable types.
     if dtype in inexact_dtypes:
       tol = 0.15  # TODO(skye): can we be more precise?
-      jtu.check_grads(jnp_fn, args_maker(), order=2, atol=tol, rtol=tol)
+      _check_grads(jnp_fn, args_maker(), tol)
 
   @parameterized.named_parameters(jtu.cases_from_list(
     {"testcase_name": f"_n={n}",
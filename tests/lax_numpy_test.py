@@ -44,6 +44,7 @@ from jax._src import device_array
 from jax._src import dtypes
 from jax._src import test_util as jtu
 from jax._src.lax import lax as lax_internal
+from jax._src.numpy import polynomial as jnp_polynomial
 from jax._src.numpy.lax_numpy import _promote_dtypes, _promote_dtypes_inexact
 from jax._src.numpy.util import _parse_numpydoc, ParsedDoc, _wraps
 from jax._src.util import prod, safe_zip
@@ -678,6 +679,30 @@ class LaxBackedNumpyTests(jtu.JaxTestCase):
     self._CheckAgainstNumpy(np_fun, jnp_fun, args_maker)
     self._CompileAndCheck(jnp_fun, args_maker)
 
+  @parameterized.named_parameters(jtu.cases_from_list(
+      {"testcase_name": "_{}_{}_invert={}".format(
+          jtu.format_shape_dtype_string(element_shape, dtype),
+          jtu.format_shape_dtype_string(test_shape, dtype), invert),
+       "element_shape": element_shape, "test_shape": test_shape,
+       "dtype": dtype, "invert": invert}
+      for element_shape in [(50,), (10, 20)]
+      for test_shape in [(100,), (16, 8)]
+      for dtype in default_dtypes + complex_dtypes
+      for invert in [True, False]))
+  def testIn1dLargeTestElements(self, element_shape, test_shape, dtype, invert):
+    # Exercises the sort-based path, which is used for large test_elements.
+    rng = jtu.rand_default(self.rng())
+    def args_maker():
+      element, test = rng(element_shape, dtype), rng(test_shape, dtype).ravel()
+      # Make about half of the elements present in test_elements.
+      matches = element.ravel()[::2]
+      test[:matches.size] = matches
+      return [element, test.reshape(test_shape)]
+    jnp_fun = lambda e, t: jnp.in1d(e, t, invert=invert)
+    np_fun = lambda e, t: np.in1d(e, t, invert=invert)
+    self._CheckAgainstNumpy(np_fun, jnp_fun, args_maker)
+    self._CompileAndCheck(jnp_fun, args_maker)
+
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name": "_{}_{}".format(
        jtu.format_shape_dtype_string(shape1, dtype1),
@@ -816,6 +841,15 @@ class LaxBackedNumpyTests(jtu.JaxTestCase):
     with jtu.strict_promotion_if_dtypes_match([dtype1, dtype2]):
       self._CheckAgainstNumpy(np_fun, jnp_fun, args_maker, check_dtypes=False)
 
+  @parameterized.parameters(False, True)
+  def testIntersect1dIndicesDtype(self, assume_unique):
+    _, ind1, ind2 = jnp.intersect1d(np.arange(5), np.arange(3, 8),
+                                    assume_unique=assume_unique,
+                                    return_indices=True)
+    int_ = dtypes.canonicalize_dtype(dtypes.int_)
+    self.assertEqual(ind1.dtype, int_)
+    self.assertEqual(ind2.dtype, int_)
+
 
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name": "_{}_{}".format(
@@ -881,6 +915,67 @@ class LaxBackedNumpyTests(jtu.JaxTestCase):
     self._CheckAgainstNumpy(np_fun, jnp_fun, args_maker, check_dtypes=False, tol=tol)
     self._CompileAndCheck(jnp_fun, args_maker, check_dtypes=False, atol=tol, rtol=tol)
 
+  @parameterized.named_parameters(jtu.cases_from_list(
+      {"testcase_name": "_dtype={}_deg={}_cov={}".format(
+          np.dtype(dtype).name, deg, cov),
+       "dtype": dtype, "deg": deg, "cov": cov}
+      for dtype in [dt for dt in float_dtypes if dt not in [jnp.float16, jnp.bfloat16]]
+      for deg in [1, 3, 5]
+      for cov in [False, True]))
+  def testPolyfitSkipScaling(self, dtype, deg, cov):
+    # Chebyshev nodes keep the unscaled Vandermonde matrix well-conditioned.
+    x = np.cos(np.pi * (np.arange(20) + 0.5) / 20).astype(dtype)
+    rng = jtu.rand_default(self.rng())
+    args_maker = lambda: [x, rng(x.shape, dtype)]
+    tol = jtu.tolerance(dtype, {np.float32: 1e-3, np.float64: 1e-12})
+    if jtu.device_under_test() == "tpu":
+      tol = 2e-1
+    jnp_fun = partial(jnp.polyfit, deg=deg, cov=cov, skip_scaling=True)
+    np_fun = partial(np.polyfit, deg=deg, cov=cov)
+    self._CheckAgainstNumpy(np_fun, jnp_fun, args_maker, check_dtypes=False, tol=tol)
+    self._CompileAndCheck(jnp_fun, args_maker, check_dtypes=False, atol=tol, rtol=tol)
+
+  @parameterized.named_parameters(jtu.cases_from_list(
+      {"testcase_name": "_{}_deg={}_w={}".format(
+          jtu.format_shape_dtype_string(shape, dtype), deg, w),
+       "shape": shape, "dtype": dtype, "deg": deg, "w": w}
+      for dtype in [dt for dt in float_dtypes if dt not in [jnp.float16, jnp.bfloat16]]
+      for shape in [(12,), (20,), (12, 2)]
+      for deg in [0, 1, 3]
+      for w in [False, True]))
+  def testPolyfitArnoldi(self, shape, dtype, deg, w):
+    rng = jtu.rand_default(self.rng())
+    tol_spec = {np.float32: 1e-3, np.float64: 1e-11}
+    if jtu.device_under_test() == "tpu":
+      tol_spec[np.float32] = 2e-1
+    tol = jtu.tolerance(dtype, tol_spec)
+    x = np.linspace(-2, 3, shape[0], dtype=dtype)
+    _w = lambda a: abs(a) + 0.5 if w else None
+    args_maker = lambda: [x, rng(shape, dtype), rng(shape[:1], dtype)]
+    # The coefficients are in different bases, so compare the fitted values.
+    def jnp_fun(x, y, a):
+      c, H = jnp_polynomial._polyfit_arnoldi(x, y, deg=deg, w=_w(a))
+      return jnp_polynomial._polyval_arnoldi(c, H, x)
+    def np_fun(x, y, a):
+      return np.vander(x, deg + 1) @ np.polyfit(x, y, deg=deg, w=_w(a))
+    self._CheckAgainstNumpy(np_fun, jnp_fun, args_maker, check_dtypes=False, tol=tol)
+    self._CompileAndCheck(jnp_fun, args_maker, check_dtypes=False, atol=tol, rtol=tol)
+
+  @jtu.skip_on_devices("tpu")  # TPU matmuls are not accurate enough here.
+  def testPolyfitArnoldiHighDegree(self):
+    if not config.x64_enabled:
+      self.skipTest("requires x64")
+    # At this degree the best monomial fit is only accurate to about 5e-4,
+    # since the Vandermonde system is numerically rank deficient.
+    x = np.linspace(-1, 1, 400)
+    y = 1 / (1 + 25 * x ** 2)
+    c, H = jnp_polynomial._polyfit_arnoldi(x, y, deg=80)
+    self.assertLess(np.abs(jnp_polynomial._polyval_arnoldi(c, H, x) - y).max(), 1e-6)
+    # The fit is also accurate between the sample points.
+    x = np.linspace(-1, 1, 1001)
+    y = 1 / (1 + 25 * x ** 2)
+    self.assertLess(np.abs(jnp_polynomial._polyval_arnoldi(c, H, x) - y).max(), 1e-4)
+
 
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name": "_{}_amin={}_amax={}".format(
@@ -1436,6 +1531,80 @@ class LaxBackedNumpyTests(jtu.JaxTestCase):
     self._CheckAgainstNumpy(np_fun, jnp_fun, args_maker, check_dtypes=False)
     self._CompileAndCheck(jnp_fun, args_maker, check_dtypes=True)
 
+  @parameterized.named_parameters(jtu.cases_from_list(
+      {"testcase_name": "_p={}_x={}_method={}".format(
+          jtu.format_shape_dtype_string(p_shape, dtype),
+          jtu.format_shape_dtype_string(x_shape, dtype), method),
+       "dtype": dtype, "p_shape": p_shape, "x_shape": x_shape, "method": method}
+      for dtype in inexact_dtypes
+      for p_shape, x_shape in [((0,), (3,)), ((1,), (3,)), ((5,), ()),
+                               ((6,), (2, 3)), ((13, 4), (3, 4)),
+                               ((7, 3, 1), (5,)), ((20,), (4,))]
+      for method in ['scan', 'estrin']))
+  def testPolyval(self, p_shape, x_shape, dtype, method):
+    rng = jtu.rand_default(self.rng())
+    x_rng = rng
+    np_fun = np.polyval
+    jnp_fun = partial(jnp.polyval, method=method)
+    tol = {dtypes.bfloat16: 4e-2, np.float16: 1e-2, np.float64: 1e-12,
+           np.complex128: 1e-12}
+    if method == 'estrin':
+      # Estrin's scheme rounds differently from numpy's Horner evaluation, which
+      # shows up under cancellation between large terms.
+      tol.update({np.float32: 5e-4, np.complex64: 2e-5})
+      if dtype in [dtypes.bfloat16, np.float16]:
+        # In 16-bit types the powers of x overflow (float16) or the rounding
+        # differences swamp the result (bfloat16) unless |x| <= 1.
+        x_rng = jtu.rand_uniform(self.rng(), -1, 1)
+        tol.update({dtypes.bfloat16: 2e-1, np.float16: 2e-2})
+    args_maker = lambda: [rng(p_shape, dtype), x_rng(x_shape, dtype)]
+    self._CheckAgainstNumpy(np_fun, jnp_fun, args_maker, check_dtypes=False,
+                            tol=tol)
+    self._CompileAndCheck(jnp_fun, args_maker, check_dtypes=True)
+
+  @parameterized.named_parameters(jtu.cases_from_list(
+      {"testcase_name": f"_degree={degree}_unroll={unroll}",
+       "degree": degree, "unroll": unroll}
+      for degree, unroll in [(3, 16), (15, 16), (16, 16), (4, 2)]))
+  def testPolyvalUnrolling(self, degree, unroll):
+    jaxpr = jax.make_jaxpr(partial(jnp.polyval, unroll=unroll))(
+        jnp.ones(degree + 1), jnp.ones(5))
+    if degree < unroll:
+      self.assertNotIn("scan", str(jaxpr))
+    else:
+      self.assertIn("scan", str(jaxpr))
+
+  @parameterized.named_parameters(jtu.cases_from_list(
+      {"testcase_name": "_p={}_x={}_tile_size={}_method={}".format(
+          p_size, jtu.format_shape_dtype_string(x_shape, np.float32),
+          tile_size, method),
+       "p_size": p_size, "x_shape": x_shape, "tile_size": tile_size,
+       "method": method}
+      for p_size in [3, 20]
+      for x_shape in [(), (7,), (4, 6)]
+      for tile_size in [1, 5, 8, 100]
+      for method in ['scan', 'estrin']))
+  def testPolyvalTiled(self, p_size, x_shape, tile_size, method):
+    rng = jtu.rand_default(self.rng())
+    args_maker = lambda: [rng((p_size,), np.float32), rng(x_shape, np.float32)]
+    jnp_fun = partial(jnp.polyval, tile_size=tile_size, method=method)
+    self._CheckAgainstNumpy(np.polyval, jnp_fun, args_maker, check_dtypes=False,
+                            tol=1e-4)
+    self._CompileAndCheck(jnp_fun, args_maker)
+
+  def testPolyvalTiledRequires1DCoefficients(self):
+    with self.assertRaisesRegex(ValueError, "tile_size requires a 1D p"):
+      jnp.polyval(jnp.ones((3, 2)), jnp.ones(2), tile_size=1)
+
+  @parameterized.parameters(0, -4)
+  def testPolyvalTiledInvalidTileSize(self, tile_size):
+    with self.assertRaisesRegex(ValueError, "tile_size must be a positive integer"):
+      jnp.polyval(jnp.ones(3), jnp.ones(8), tile_size=tile_size)
+
+  def testPolyvalInvalidMethod(self):
+    with self.assertRaisesRegex(ValueError, "'horner' is an invalid value"):
+      jnp.polyval(jnp.ones(3), 1.0, method='horner')
+
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name": f"_ptype={ptype}", "ptype": ptype}
       for ptype in ['int', 'np.int', 'jnp.int']))
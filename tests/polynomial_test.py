@@ -129,6 +129,18 @@ class TestPolynomial(jtu.JaxTestCase):
     self.assertSetsAllClose(np_roots, jnp_roots)
     self._CompileAndCheck(jnp_fun, args_maker)
 
+  @parameterized.named_parameters(jtu.cases_from_list(
+    {"testcase_name": f"_p={p}", "p": p}
+    for p in [[2, 3], [1, 0, 0], [1, -2, 1], [1, 0, 1], [2, 3, -5], [1, 1e4, 1],
+              [1j, 2, 3 - 1j], [1, -3, 0]]))
+  def testRootsLowDegree(self, p):
+    # Linear and quadratic polynomials use closed forms, so unlike the tests
+    # above these run on all devices.
+    p = np.array(p, dtype=np.complex64 if np.iscomplexobj(p) else np.float32)
+    np_roots = np.roots(p).astype(dtypes.to_complex_dtype(p.dtype))
+    jnp_roots = jnp.roots(p)
+    self.assertSetsAllClose(np_roots, jnp_roots, rtol=1e-5, atol=1e-5)
+
 
 if __name__ == "__main__":
   absltest.main(testLoader=jtu.JaxTestLoader())